@@ -17,6 +17,12 @@ STATIC_COMMANDS = [
     "du -sh ~/Documents/* | sort -hr | head -n 10"
 ]
 
+# STATIC_COMMANDS has a power-of-two length, so a getrandbits index is
+# cheaper than random.choice's bounds-checked _randbelow path.
+_N = len(STATIC_COMMANDS)
+_BITS = _N.bit_length() - 1
+assert 1 << _BITS == _N, "STATIC_COMMANDS length must stay a power of two"
+
 def get_next_command(_memory=None):
     # Kept for backward compatibility; delegates to decide_next_action
     return decide_next_action()
@@ -24,7 +30,7 @@ def get_next_command(_memory=None):
 def decide_next_action():
     # In future, use memory context to query LLM
     if not USE_LLM:
-        return random.choice(STATIC_COMMANDS)
+        return STATIC_COMMANDS[random.getrandbits(_BITS)]
 
     # Placeholder for future LLM integration
     return "echo 'LLM mode not yet implemented'"
@@ -1,4 +1,6 @@
+import atexit
 import json, os, time, random
+import tempfile
 import threading
 import sys
 
@@ -9,13 +11,15 @@ if ROOT_DIR not in sys.path:
 from datetime import datetime
 try:
     from rich.console import Console
+    from rich.style import Style
 except Exception:
+    Style = None
     class Console:  # minimal fallback
-        def print(self, *args):
+        def print(self, *args, **kwargs):
             print(*args)
         def rule(self, text):
             print("\n" + str(text))
-from agent_core.shell_exec import run_shell_command
+from agent_core.shell_exec import run_shell_command, run_shell_batch
 from agent_core.brain import decide_next_action
 from queue_handler import get_next_command as get_queued_command
 from ui.control_ui import launch_ui
@@ -25,56 +29,179 @@ try:
 except Exception:
     # Optional dependency (transformers) may be missing; reflection is best-effort
     reflect_and_score = None
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except Exception:
+    # Optional; without watchdog we fall back to stat-based polling
+    Observer = None
+    FileSystemEventHandler = object
 
 console = Console()
 
+# Precomputed styles so hot-loop prints skip Rich's markup/highlight regex
+if Style is not None:
+    _DIM = Style(dim=True)
+    _BOLD = Style(bold=True)
+    _BOLD_YELLOW = Style(bold=True, color="yellow")
+    _RED = Style(color="red")
+else:
+    _DIM = _BOLD = _BOLD_YELLOW = _RED = None
+
 # File constants
 MEMORY_FILE = os.path.join(ROOT_DIR, "agent_memory.json")
 MODE_FILE = os.path.join(ROOT_DIR, "mode_flag.json")
 
+# mtime-keyed caches so the loop doesn't re-read/parse unchanged files every tick
+_MODE_CACHE = {"mtime": 0, "value": "auto"}
+_MODE_EVENTS = False
+_MEMORY_CACHE = {"mtime": 0, "value": None}
+_MEMORY_DIRTY = False
+
 # Load or initialize memory
 def load_memory():
-    if os.path.exists(MEMORY_FILE):
-        with open(MEMORY_FILE) as f:
-            return json.load(f)
-    return {"history": [], "last_result": ""}
+    try:
+        st = os.stat(MEMORY_FILE)
+    except OSError:
+        return {"history": [], "last_result": ""}
+    if _MEMORY_DIRTY and _MEMORY_CACHE["value"] is not None:
+        # Staged but not yet flushed; the cache is newer than the file
+        return _MEMORY_CACHE["value"]
+    if st.st_mtime_ns == _MEMORY_CACHE["mtime"] and _MEMORY_CACHE["value"] is not None:
+        return _MEMORY_CACHE["value"]
+    with open(MEMORY_FILE) as f:
+        memory = json.load(f)
+    _MEMORY_CACHE["mtime"] = st.st_mtime_ns
+    _MEMORY_CACHE["value"] = memory
+    return memory
 
 def save_memory(memory):
-    with open(MEMORY_FILE, "w") as f:
-        json.dump(memory, f, indent=2)
+    # Stage in the cache and defer the disk write; the agent loop flushes
+    # once per iteration instead of rewriting the file on every mutation.
+    global _MEMORY_DIRTY
+    _MEMORY_CACHE["value"] = memory
+    _MEMORY_DIRTY = True
 
-def get_mode():
-    if os.path.exists(MODE_FILE):
+def _flush_if_dirty():
+    """Write staged memory to disk as a single compact payload."""
+    global _MEMORY_DIRTY
+    if not _MEMORY_DIRTY or _MEMORY_CACHE["value"] is None:
+        return
+    payload = json.dumps(_MEMORY_CACHE["value"], separators=(",", ":")).encode()
+    # Write-to-tmp + rename so concurrent readers (ui.control_ui polls this
+    # file) never observe an empty or partially written file
+    dirname = os.path.dirname(MEMORY_FILE) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=".mem.", dir=dirname)
+    try:
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, MEMORY_FILE)
+    finally:
+        try:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        except OSError:
+            pass
+    _MEMORY_DIRTY = False
+    try:
+        _MEMORY_CACHE["mtime"] = os.stat(MEMORY_FILE).st_mtime_ns
+    except OSError:
+        pass
+
+# save_memory only stages; make sure staged state reaches disk even when
+# the process exits outside agent_loop's per-iteration flush
+atexit.register(_flush_if_dirty)
+
+def _refresh_mode_cache():
+    try:
+        st = os.stat(MODE_FILE)
         with open(MODE_FILE) as f:
-            return json.load(f).get("mode", "auto")
-    return "auto"
+            _MODE_CACHE["value"] = json.load(f).get("mode", "auto")
+        _MODE_CACHE["mtime"] = st.st_mtime_ns
+    except (OSError, ValueError):
+        pass
+
+def _start_mode_watcher():
+    """Subscribe to MODE_FILE changes so get_mode() does zero I/O per tick.
+
+    Best-effort: if watchdog is missing or the observer fails to start,
+    get_mode() keeps its stat-based cache.
+    """
+    global _MODE_EVENTS
+    if Observer is None:
+        return
+
+    class _ModeHandler(FileSystemEventHandler):
+        def on_modified(self, event):
+            if os.path.abspath(str(event.src_path)) == MODE_FILE:
+                _refresh_mode_cache()
+
+        on_created = on_modified
+        on_moved = on_modified
+
+    try:
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_ModeHandler(), os.path.dirname(MODE_FILE) or ".", recursive=False)
+        observer.start()
+        _refresh_mode_cache()
+        _MODE_EVENTS = True
+    except Exception:
+        _MODE_EVENTS = False
+
+def get_mode():
+    if _MODE_EVENTS:
+        # Event-driven: the watcher already refreshed the cache on change
+        return _MODE_CACHE["value"]
+    try:
+        st = os.stat(MODE_FILE)
+    except OSError:
+        return "auto"
+    if st.st_mtime_ns == _MODE_CACHE["mtime"]:
+        return _MODE_CACHE["value"]
+    with open(MODE_FILE) as f:
+        mode = json.load(f).get("mode", "auto")
+    _MODE_CACHE["mtime"] = st.st_mtime_ns
+    _MODE_CACHE["value"] = mode
+    return mode
 
 def agent_loop():
+    _start_mode_watcher()
     i = 0
     while True:
         console.rule(f"[bold blue]Agent Loop @ {datetime.now()}")
 
         # Read mode each loop
         mode = get_mode()
-        console.print(f"[bold yellow]Mode: {mode.upper()}")
-
-        # Check for manual command first
-        user_cmd = get_queued_command()
-        if user_cmd:
-            console.print(f"[MANUAL] {user_cmd}")
-            result = run_shell_command(user_cmd)
-            log_memory(user_cmd, result)
-            console.print(f"[dim]{result[:500]}")
+        console.print(f"Mode: {mode.upper()}", style=_BOLD_YELLOW, markup=False, highlight=False)
+
+        # Check for manual commands first; drain a few per tick and run them
+        # in one shell invocation instead of one subprocess each
+        user_cmds = []
+        while len(user_cmds) < 5:
+            user_cmd = get_queued_command()
+            if not user_cmd:
+                break
+            user_cmds.append(user_cmd)
+        if user_cmds:
+            results = run_shell_batch(user_cmds)
+            for user_cmd, result in zip(user_cmds, results):
+                console.print(f"[MANUAL] {user_cmd}", style=_BOLD, markup=False, highlight=False)
+                log_memory(user_cmd, result)
+                console.print(result[:500], style=_DIM, markup=False, highlight=False)
+            _flush_if_dirty()
             time.sleep(3)
             continue
 
         # Fallback to auto mode
         if mode == "auto":
             cmd = decide_next_action()
-            console.print(f"[AUTO] {cmd}")
+            console.print(f"[AUTO] {cmd}", style=_BOLD, markup=False, highlight=False)
             result = run_shell_command(cmd)
             log_memory(cmd, result)
-            console.print(f"[dim]{result[:500]}")
+            console.print(result[:500], style=_DIM, markup=False, highlight=False)
         else:
             # Manual mode with empty queue -> idle
             time.sleep(3)
@@ -87,8 +214,9 @@ def agent_loop():
                 reflection = reflect_and_score()
                 console.print("REFLECTED:", reflection)
             except Exception as e:
-                console.print(f"[red]Reflection failed: {e}")
+                console.print(f"Reflection failed: {e}", style=_RED, markup=False, highlight=False)
 
+        _flush_if_dirty()
         time.sleep(3)
 
 if __name__ == "__main__":
@@ -1,28 +1,107 @@
+import asyncio
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+try:
+    # C-backed HTML parser; much faster than html.parser on real pages
+    from selectolax.parser import HTMLParser
+except Exception:
+    HTMLParser = None
+try:
+    import httpx
+except Exception:
+    httpx = None
+
+# Shared session: reuses TCP/TLS connections and DNS lookups across calls
+# instead of paying a fresh handshake per request.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=1)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Short TTL cache for GETs so repeated pulls of the same URL skip the
+# round-trip entirely. Maps (method, url) -> (expiry, value).
+_HTTP_CACHE_TTL = 60.0
+_HTTP_CACHE_MAX = 256
+_HTTP_CACHE: dict[tuple[str, str], tuple[float, object]] = {}
+
+def _cache_get(key):
+    hit = _HTTP_CACHE.get(key)
+    if hit and time.monotonic() < hit[0]:
+        return hit[1]
+    return None
+
+def _cache_put(key, value):
+    if len(_HTTP_CACHE) >= _HTTP_CACHE_MAX:
+        # Drop expired entries first; clear outright if still full
+        now = time.monotonic()
+        for k in [k for k, (exp, _) in _HTTP_CACHE.items() if exp <= now]:
+            del _HTTP_CACHE[k]
+        if len(_HTTP_CACHE) >= _HTTP_CACHE_MAX:
+            _HTTP_CACHE.clear()
+    _HTTP_CACHE[key] = (time.monotonic() + _HTTP_CACHE_TTL, value)
 
 def fetch_url(url):
+    key = ("GET", url)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     try:
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
+        _cache_put(key, response.text)
         return response.text
     except Exception as e:
         return f"[ERROR] {e}"
 
 def scrape_text(url):
     html = fetch_url(url)
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        body = tree.body or tree.root
+        return body.text(separator=" ") if body is not None else ""
     soup = BeautifulSoup(html, 'html.parser')
     return soup.get_text()
 
 def simple_api_pull(url):
+    key = ("GET-JSON", url)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
     try:
-        response = requests.get(url, timeout=5)
-        return response.json()
+        response = _SESSION.get(url, timeout=5)
+        data = response.json()
+        _cache_put(key, data)
+        return data
     except Exception as e:
         return f"[ERROR] {e}"
 
+async def fetch_urls(urls):
+    """Fetch many URLs concurrently; total latency is max(RTT), not sum.
+
+    Returns one body string (or "[ERROR] ..." marker) per URL, in order.
+    Falls back to serial fetches over the pooled session if httpx is missing.
+    """
+    if httpx is None:
+        return [fetch_url(u) for u in urls]
+
+    async with httpx.AsyncClient(timeout=10) as client:
+        async def _one(u):
+            try:
+                response = await client.get(u)
+                return response.text
+            except Exception as e:
+                return f"[ERROR] {e}"
+        return list(await asyncio.gather(*(_one(u) for u in urls)))
+
+def fetch_urls_sync(urls):
+    """Blocking convenience wrapper around fetch_urls."""
+    return asyncio.run(fetch_urls(urls))
+
 def post_data(url, payload):
     try:
-        response = requests.post(url, json=payload, timeout=5)
+        response = _SESSION.post(url, json=payload, timeout=5)
         return response.json()
     except Exception as e:
         return f"[ERROR] {e}"
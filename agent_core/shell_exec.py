@@ -1,16 +1,72 @@
 import subprocess
+import time
+
+# Known read-only commands and how long their output stays fresh (seconds).
+# Cache hits skip the fork+exec entirely.
+_CMD_TTL = {
+    "whoami": 3600,
+    "uptime": 5,
+    "df -h": 30,
+    "netstat -tulnp": 10,
+}
+_CMD_CACHE: dict[str, tuple[float, str]] = {}
 
 def run_shell_command(command):
+    ttl = _CMD_TTL.get(command)
+    if ttl:
+        expiry, output = _CMD_CACHE.get(command, (0.0, None))
+        if output is not None and time.monotonic() < expiry:
+            return output
     try:
         result = subprocess.run(
             command,
             shell=True,
             capture_output=True,
             text=True,
-            timeout=60  # prevent hangups
+            timeout=60,  # prevent hangups
+            # Skip the per-spawn fd scan; commands inherit our descriptors,
+            # which is acceptable for this local-operator use case.
+            close_fds=False,
         )
-        return result.stdout if result.returncode == 0 else result.stderr
+        output = result.stdout if result.returncode == 0 else result.stderr
+        if ttl and result.returncode == 0:
+            _CMD_CACHE[command] = (time.monotonic() + ttl, output)
+        return output
     except subprocess.TimeoutExpired:
         return "[ERROR] Command timed out."
     except Exception as e:
         return f"[ERROR] Execution failed: {str(e)}"
+
+# Record separator; vanishingly unlikely to appear in command output.
+_BATCH_SEP = "\x1e"
+
+def run_shell_batch(commands):
+    """Run several commands in one shell invocation to amortize fork+exec.
+
+    Returns one output string per command, in order.
+    """
+    if not commands:
+        return []
+    if len(commands) == 1:
+        return [run_shell_command(commands[0])]
+    joined = f"; printf '{_BATCH_SEP}'; ".join(commands)
+    try:
+        # Merge stderr into stdout so a failing command's diagnostics land
+        # in its slot instead of being discarded
+        result = subprocess.run(
+            ["bash", "-c", joined],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=60 * len(commands),
+            close_fds=False,
+        )
+        outputs = result.stdout.split(_BATCH_SEP)
+    except subprocess.TimeoutExpired:
+        return ["[ERROR] Command timed out."] * len(commands)
+    except Exception as e:
+        return [f"[ERROR] Execution failed: {str(e)}"] * len(commands)
+    # Pad in case a command aborted the shell early
+    while len(outputs) < len(commands):
+        outputs.append("")
+    return outputs[: len(commands)]
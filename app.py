@@ -1,8 +1,10 @@
 import os
 import sys
-import json
 import time
+import queue
 import threading
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
 
 try:
@@ -21,7 +23,8 @@ if APP_ROOT not in sys.path:
 
 import autonomy_core as core  # uses agent_memory.json in repo root
 
-REFRESH_MS = 1000  # UI refresh cadence
+REFRESH_MS = 1000      # background loader cadence
+FAILSAFE_MS = 10000    # failsafe repaint period; normal refreshes are event-driven
 SLEEP_SECS = 2     # Agent loop cadence
 MAX_LOG_ROWS = 500
 
@@ -58,13 +61,26 @@ ST_BTN_SUCCESS = "Success.TButton"
 ST_BTN_DANGER = "Danger.TButton"
 
 
-def ts_fmt(ts: float) -> str:
+# Compiled table: one translate() pass beats chained .replace() calls
+_NL_TO_SPACE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+
+@lru_cache(maxsize=2048)
+def _ts_fmt_int(ts: int) -> str:
     try:
         return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
     except Exception:
         return "-"
 
 
+def ts_fmt(ts: float) -> str:
+    # Quantize to whole seconds so repeated timestamps hit the cache
+    try:
+        return _ts_fmt_int(int(ts))
+    except (TypeError, ValueError):
+        return "-"
+
+
 class AgentApp:
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -77,19 +93,41 @@ class AgentApp:
         self.agent_thread = None
         self.stop_event = threading.Event()
         self.auto_thread = None
-        self.lock = threading.Lock()
+        # Re-entrant so helper methods can nest under an already-held lock
+        self.lock = threading.RLock()
 
         # UI variables
         self.state_var = tk.StringVar(value="stopped")
         self.tasks_var = tk.StringVar(value="")
 
+        # Incremental-refresh bookkeeping
+        self._last_mem_mtime = -1
+        self._log_ring: deque = deque(maxlen=MAX_LOG_ROWS)
+        self._log_ids: deque = deque()  # shown iids, oldest first
+        self._last_log_ts = ""
+        self._last_tasks: list = []
+        self._row_seq = 0
+        self._row_payloads: dict[str, dict] = {}
+        self._pending_refresh = None
+
         # Build UI
         self._build_layout()
         self._configure_grid()
 
-        # First paint
+        # Background memory loader: keeps JSON parsing off the Tk main thread.
+        # maxsize=1 so the loader never buffers stale snapshots.
+        self._mem_q = queue.Queue(maxsize=1)
+        self._loader_thread = threading.Thread(target=self._mem_loader, name="mem-loader", daemon=True)
+        self._loader_thread.start()
+
+        # Event-driven refresh: core signals each write, so the UI repaints
+        # on change instead of polling every second
+        self.root.bind("<<MemChanged>>", self._on_mem_changed)
+        core.set_on_change(self._notify_mem_changed)
+
+        # First paint; the periodic poll remains only as a failsafe
         self.refresh_views()
-        self.root.after(REFRESH_MS, self._poll_refresh)
+        self.root.after(FAILSAFE_MS, self._poll_refresh)
 
         # Handle close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -97,34 +135,36 @@ class AgentApp:
     # ---------- UI setup ----------
     def _apply_modern_theme(self):
         """Apply modern dark theme with professional styling"""
-    self.root.configure(bg=COLORS['bg'])
+        self.root.configure(bg=COLORS['bg'])
 
         # Configure fonts
-    self.title_font = tkFont.Font(family=FONT_SANS, size=16, weight="bold")
-    self.header_font = tkFont.Font(family=FONT_SANS, size=12, weight="bold")
-    self.body_font = tkFont.Font(family=FONT_SANS, size=10)
-    self.mono_font = tkFont.Font(family=FONT_MONO, size=9)
-
-    style = ttk.Style()
-    style.theme_use('clam')
-    # Base
-    style.configure("TFrame", background=COLORS['bg'], relief="flat")
-    style.configure(ST_CARD, background=COLORS['surface'], relief="solid", borderwidth=1)
-    style.configure("TLabel", background=COLORS['bg'], foreground=COLORS['text'], font=self.body_font)
-    style.configure(ST_TITLE_LABEL, background=COLORS['bg'], foreground=COLORS['text'], font=self.title_font)
-    style.configure(ST_HEADER_LABEL, background=COLORS['surface'], foreground=COLORS['text'], font=self.header_font)
-    style.configure(ST_MUTED_LABEL, background=COLORS['bg'], foreground=COLORS['text_muted'], font=self.body_font)
-    # Buttons
-    style.configure("TButton", background=COLORS['primary'], foreground="white", font=self.body_font, relief="flat", borderwidth=0, padding=(12, 8))
-    style.map("TButton", background=[('active', COLORS['primary_dark'])], relief=[('pressed', 'flat')])
-    style.configure(ST_BTN_SUCCESS, background=COLORS['success'])
-    style.map("Success.TButton", background=[('active', '#059669')])
-    style.configure(ST_BTN_DANGER, background=COLORS['danger'])
-    style.map("Danger.TButton", background=[('active', '#dc2626')])
-    # Entry & Treeview
-    style.configure("TEntry", fieldbackground=COLORS['surface_light'], foreground=COLORS['text'], borderwidth=1, relief="solid", font=self.body_font, insertcolor=COLORS['text'])
-    style.configure("Treeview", background=COLORS['surface'], foreground=COLORS['text'], fieldbackground=COLORS['surface'], font=self.body_font, rowheight=24)
-    style.configure("Treeview.Heading", background=COLORS['surface_light'], foreground=COLORS['text'], font=self.header_font)
+        self.title_font = tkFont.Font(family=FONT_SANS, size=16, weight="bold")
+        self.header_font = tkFont.Font(family=FONT_SANS, size=12, weight="bold")
+        self.body_font = tkFont.Font(family=FONT_SANS, size=10)
+        self.mono_font = tkFont.Font(family=FONT_MONO, size=9)
+
+        # Single Style instance; re-creating it rebuilds the style database
+        self.style = ttk.Style(self.root)
+        style = self.style
+        style.theme_use('clam')
+        # Base
+        style.configure("TFrame", background=COLORS['bg'], relief="flat")
+        style.configure(ST_CARD, background=COLORS['surface'], relief="solid", borderwidth=1)
+        style.configure("TLabel", background=COLORS['bg'], foreground=COLORS['text'], font=self.body_font)
+        style.configure(ST_TITLE_LABEL, background=COLORS['bg'], foreground=COLORS['text'], font=self.title_font)
+        style.configure(ST_HEADER_LABEL, background=COLORS['surface'], foreground=COLORS['text'], font=self.header_font)
+        style.configure(ST_MUTED_LABEL, background=COLORS['bg'], foreground=COLORS['text_muted'], font=self.body_font)
+        # Buttons
+        style.configure("TButton", background=COLORS['primary'], foreground="white", font=self.body_font, relief="flat", borderwidth=0, padding=(12, 8))
+        style.map("TButton", background=[('active', COLORS['primary_dark'])], relief=[('pressed', 'flat')])
+        style.configure(ST_BTN_SUCCESS, background=COLORS['success'])
+        style.map("Success.TButton", background=[('active', '#059669')])
+        style.configure(ST_BTN_DANGER, background=COLORS['danger'])
+        style.map("Danger.TButton", background=[('active', '#dc2626')])
+        # Entry & Treeview
+        style.configure("TEntry", fieldbackground=COLORS['surface_light'], foreground=COLORS['text'], borderwidth=1, relief="solid", font=self.body_font, insertcolor=COLORS['text'])
+        style.configure("Treeview", background=COLORS['surface'], foreground=COLORS['text'], fieldbackground=COLORS['surface'], font=self.body_font, rowheight=24)
+        style.configure("Treeview.Heading", background=COLORS['surface_light'], foreground=COLORS['text'], font=self.header_font)
 
     def _build_layout(self):
         """Build modern card-based layout"""
@@ -133,27 +173,27 @@ class AgentApp:
         main_container.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
 
         # Header with title and controls
-    header = ttk.Frame(main_container, style=ST_CARD)
+        header = ttk.Frame(main_container, style=ST_CARD)
         header.grid(row=0, column=0, columnspan=3, sticky="ew", pady=(0, 20))
         header.grid_columnconfigure(1, weight=1)
 
         # Title
-    title_lbl = ttk.Label(header, text="🤖 AGENT-i", style=ST_TITLE_LABEL)
+        title_lbl = ttk.Label(header, text="🤖 AGENT-i", style=ST_TITLE_LABEL)
         title_lbl.grid(row=0, column=0, padx=20, pady=15)
 
         # Status indicator
         status_frame = ttk.Frame(header)
         status_frame.grid(row=0, column=1, padx=20)
-    ttk.Label(status_frame, text="Status:", style=ST_MUTED_LABEL).grid(row=0, column=0, padx=(0, 8))
-    self.state_lbl = ttk.Label(status_frame, textvariable=self.state_var, style=ST_HEADER_LABEL)
+        ttk.Label(status_frame, text="Status:", style=ST_MUTED_LABEL).grid(row=0, column=0, padx=(0, 8))
+        self.state_lbl = ttk.Label(status_frame, textvariable=self.state_var, style=ST_HEADER_LABEL)
         self.state_lbl.grid(row=0, column=1)
 
         # Control buttons
         controls = ttk.Frame(header)
         controls.grid(row=0, column=2, padx=20, pady=15)
-    self.start_btn = ttk.Button(controls, text="▶ Start Agent", command=self.start_agent, style=ST_BTN_SUCCESS)
+        self.start_btn = ttk.Button(controls, text="▶ Start Agent", command=self.start_agent, style=ST_BTN_SUCCESS)
         self.start_btn.grid(row=0, column=0, padx=(0, 8))
-    self.stop_btn = ttk.Button(controls, text="⏹ Stop Agent", command=self.stop_agent, style=ST_BTN_DANGER)
+        self.stop_btn = ttk.Button(controls, text="⏹ Stop Agent", command=self.stop_agent, style=ST_BTN_DANGER)
         self.stop_btn.grid(row=0, column=1, padx=(0, 8))
         self.refresh_btn = ttk.Button(controls, text="🔄 Refresh", command=self.refresh_views)
         self.refresh_btn.grid(row=0, column=2, padx=(0, 8))
@@ -161,14 +201,14 @@ class AgentApp:
         self.export_btn.grid(row=0, column=3)
 
         # Autonomy helpers inline controls
-    auto_frame = ttk.Frame(header)
+        auto_frame = ttk.Frame(header)
         auto_frame.grid(row=1, column=0, columnspan=3, sticky="ew", padx=20, pady=(0, 12))
         auto_frame.grid_columnconfigure(6, weight=1)
-    ttk.Label(auto_frame, text="Auto steps:", style=ST_MUTED_LABEL).grid(row=0, column=0, padx=(0, 6))
+        ttk.Label(auto_frame, text="Auto steps:", style=ST_MUTED_LABEL).grid(row=0, column=0, padx=(0, 6))
         self.auto_steps = ttk.Entry(auto_frame, width=6)
         self.auto_steps.insert(0, "5")
         self.auto_steps.grid(row=0, column=1, padx=(0, 10))
-    ttk.Label(auto_frame, text="Goal:", style=ST_MUTED_LABEL).grid(row=0, column=2, padx=(0, 6))
+        ttk.Label(auto_frame, text="Goal:", style=ST_MUTED_LABEL).grid(row=0, column=2, padx=(0, 6))
         self.auto_goal = ttk.Entry(auto_frame, width=40)
         self.auto_goal.grid(row=0, column=3, padx=(0, 10))
         ttk.Button(auto_frame, text="⚙️ Auto Cycle", command=self.auto_cycle).grid(row=0, column=4, padx=(0, 10))
@@ -177,9 +217,9 @@ class AgentApp:
         ttk.Button(auto_frame, text="🧠 Synthesize", command=self.synthesize).grid(row=0, column=7)
 
         # Task Management Card
-    tasks_card = ttk.Frame(main_container, style=ST_CARD)
+        tasks_card = ttk.Frame(main_container, style=ST_CARD)
         tasks_card.grid(row=1, column=0, sticky="nsew", padx=(0, 10), pady=(0, 20))
-    tasks_header = ttk.Label(tasks_card, text="Task Queue", style=ST_HEADER_LABEL)
+        tasks_header = ttk.Label(tasks_card, text="Task Queue", style=ST_HEADER_LABEL)
         tasks_header.grid(row=0, column=0, columnspan=2, padx=20, pady=(15, 10), sticky="w")
 
         # Task list with modern styling
@@ -205,9 +245,9 @@ class AgentApp:
         self.ask_ai_btn.grid(row=0, column=2, padx=(8, 0))
 
         # Execution Logs Card
-    logs_card = ttk.Frame(main_container, style=ST_CARD)
+        logs_card = ttk.Frame(main_container, style=ST_CARD)
         logs_card.grid(row=1, column=1, columnspan=2, sticky="nsew", padx=(10, 0))
-    logs_header = ttk.Label(logs_card, text="Execution History", style=ST_HEADER_LABEL)
+        logs_header = ttk.Label(logs_card, text="Execution History", style=ST_HEADER_LABEL)
         logs_header.grid(row=0, column=0, padx=20, pady=(15, 10), sticky="w")
 
         # Treeview for logs
@@ -227,16 +267,23 @@ class AgentApp:
         logs_scroll_y.grid(row=0, column=1, sticky="ns")
 
         # Log Detail Card
-    detail_card = ttk.Frame(main_container, style=ST_CARD)
+        detail_card = ttk.Frame(main_container, style=ST_CARD)
         detail_card.grid(row=2, column=0, columnspan=3, sticky="nsew", pady=(20, 0))
-    detail_header = ttk.Label(detail_card, text="📋 Selected Log Details", style=ST_HEADER_LABEL)
+        detail_header = ttk.Label(detail_card, text="📋 Selected Log Details", style=ST_HEADER_LABEL)
         detail_header.grid(row=0, column=0, padx=20, pady=(15, 10), sticky="w")
-        detail_frame = ttk.Frame(detail_card)
-        detail_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
-        self.detail = ScrolledText(detail_frame, height=8, wrap=tk.WORD, font=self.mono_font, bg=COLORS['surface_light'], fg=COLORS['text'], insertbackground=COLORS['text'], relief="flat", borderwidth=0)
-        self.detail.grid(row=0, column=0, sticky="nsew")
+        # Heavy ScrolledText is deferred until a row is first selected;
+        # cold start only pays for the empty frame
+        self._detail_frame = ttk.Frame(detail_card)
+        self._detail_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
+        self.detail = None
         self.logs.bind("<<TreeviewSelect>>", self._on_log_select)
 
+    def _ensure_detail(self):
+        if self.detail is None:
+            self.detail = ScrolledText(self._detail_frame, height=8, wrap=tk.WORD, font=self.mono_font, bg=COLORS['surface_light'], fg=COLORS['text'], insertbackground=COLORS['text'], relief="flat", borderwidth=0)
+            self.detail.grid(row=0, column=0, sticky="nsew")
+        return self.detail
+
     def _configure_grid(self):
         """Configure grid weights for responsive layout"""
         self.root.grid_columnconfigure(0, weight=1)
@@ -271,6 +318,7 @@ class AgentApp:
             self.state_var.set("stopped")
             return
         self.stop_event.set()
+        core.notify_tasks()  # unblock a waiting loop promptly
         self.agent_thread.join(timeout=5)
         self.state_var.set("stopped")
         self.agent_thread = None
@@ -279,6 +327,8 @@ class AgentApp:
         mem.setdefault("state", {})
         mem["state"]["mode"] = "stopped"
         core.save_memory(mem)
+        # Fsyncs are batched; make the final state durable now
+        core.sync_memory()
 
     def _agent_loop(self):
         # Initialize state
@@ -289,13 +339,29 @@ class AgentApp:
             core.save_memory(mem)
 
         while not self.stop_event.is_set():
-            with self.lock:
-                core.execute_next_task()
-            # Allow quick stop
-            if self.stop_event.wait(SLEEP_SECS):
-                break
+            # Block until work arrives; an empty queue no longer triggers an
+            # execute/save round-trip every SLEEP_SECS
+            if core.wait_for_task(timeout=SLEEP_SECS):
+                with self.lock:
+                    core.execute_next_task()
 
     # ---------- Autonomy helpers ----------
+    def _toast(self, text: str, ms: int = 2500):
+        """Show a non-blocking notification that dismisses itself."""
+        try:
+            toast = tk.Toplevel(self.root)
+            toast.overrideredirect(True)
+            toast.attributes("-topmost", True)
+            tk.Label(toast, text=text, bg=COLORS['text'], fg="white",
+                     font=(FONT_SANS, 10), padx=14, pady=8).pack()
+            self.root.update_idletasks()
+            x = self.root.winfo_rootx() + self.root.winfo_width() - toast.winfo_reqwidth() - 40
+            y = self.root.winfo_rooty() + self.root.winfo_height() - toast.winfo_reqheight() - 40
+            toast.geometry(f"+{x}+{y}")
+            toast.after(ms, toast.destroy)
+        except tk.TclError:
+            pass
+
     def auto_cycle(self):
         if self.auto_thread and self.auto_thread.is_alive():
             return
@@ -313,69 +379,127 @@ class AgentApp:
         self.auto_thread.start()
 
     def plan_tasks(self):
+        # LLM calls run on a worker thread; results are posted back to the
+        # UI thread so the window never freezes on a slow request
         goal = self.auto_goal.get().strip() or None
-        try:
-            tasks = core.plan_tasks_with_llm(goal=goal)
-        except Exception as e:
-            messagebox.showerror(TITLE_PLAN, f"Planning failed: {e}")
-            return
+
+        def run():
+            try:
+                tasks = core.plan_tasks_with_llm(goal=goal)
+            except Exception as e:
+                self.root.after_idle(lambda: messagebox.showerror(TITLE_PLAN, f"Planning failed: {e}"))
+                return
+            self.root.after_idle(lambda: self._apply_planned(tasks))
+
+        threading.Thread(target=run, name="plan-tasks", daemon=True).start()
+
+    def _apply_planned(self, tasks):
         if not tasks:
-            messagebox.showinfo(TITLE_PLAN, "No tasks proposed (LLM unavailable or empty response).")
+            self._toast("No tasks proposed (LLM unavailable or empty response).")
             return
         with self.lock:
-            for t in tasks[:5]:
-                core.inject_task(t)
+            core.inject_tasks(tasks[:5])
         self.refresh_views()
 
     def reflect(self):
-        try:
-            tasks = core.reflect_on_last_output() or []
-        except Exception as e:
-            messagebox.showerror(TITLE_REFLECT, f"Reflection failed: {e}")
-            return
+        def run():
+            try:
+                tasks = core.reflect_on_last_output() or []
+            except Exception as e:
+                self.root.after_idle(lambda: messagebox.showerror(TITLE_REFLECT, f"Reflection failed: {e}"))
+                return
+            self.root.after_idle(lambda: self._apply_reflection(tasks))
+
+        threading.Thread(target=run, name="reflect", daemon=True).start()
+
+    def _apply_reflection(self, tasks):
         if not tasks:
-            messagebox.showinfo("Reflect", "No suggestions (need at least one prior log, or LLM unavailable).")
+            self._toast("No suggestions (need at least one prior log, or LLM unavailable).")
             return
         with self.lock:
-            for t in tasks[:3]:
-                core.inject_task(t)
+            core.inject_tasks(tasks[:3])
         self.refresh_views()
 
     def synthesize(self):
-        try:
-            out = core.synthesize_knowledge()
-        except Exception as e:
-            messagebox.showerror(TITLE_SYNTH, f"Failed: {e}")
-            return
-        if out:
-            messagebox.showinfo(TITLE_SYNTH, "Session summary updated in state.")
-        else:
-            messagebox.showinfo(TITLE_SYNTH, "No summary (LLM unavailable).")
+        def run():
+            try:
+                out = core.synthesize_knowledge()
+            except Exception as e:
+                self.root.after_idle(lambda: messagebox.showerror(TITLE_SYNTH, f"Failed: {e}"))
+                return
+            if out:
+                self.root.after_idle(lambda: self._toast("Session summary updated in state."))
+            else:
+                self.root.after_idle(lambda: self._toast("No summary (LLM unavailable)."))
+
+        threading.Thread(target=run, name="synthesize", daemon=True).start()
 
     # ---------- Data ops ----------
-    def refresh_views(self):
-        with self.lock:
+    def _mem_loader(self):
+        """Daemon thread: load memory off the UI thread and hand snapshots over."""
+        while True:
+            time.sleep(REFRESH_MS / 1000.0)
+            mem = self._safe_load_memory()
+            try:
+                self._mem_q.put_nowait(mem)
+            except queue.Full:
+                # UI hasn't consumed the last snapshot yet; drop this one
+                pass
+
+    def refresh_views(self, mem=None):
+        # Cheap early-out: nothing to repaint if state and log files are untouched
+        mtime = 0
+        for path in (core.MEMORY_FILE, core.LOGS_FILE):
+            try:
+                mtime ^= os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+        if mtime and mtime == self._last_mem_mtime:
+            return
+        self._last_mem_mtime = mtime
+        # Reads need no lock: save_memory writes via tmp + atomic rename,
+        # so a reader always sees a fully-written file
+        if mem is None:
             mem = self._safe_load_memory()
         # State
         state = mem.get("state", {})
         mode = state.get("mode", "stopped")
         self.state_var.set(mode)
-        # Tasks
-        self.tasks_list.delete(0, tk.END)
-        for t in mem.get("tasks", []):
-            self.tasks_list.insert(tk.END, t)
-        # Logs -> latest first
-        self.logs.delete(*self.logs.get_children())
-        logs = list(core.get_logs(mem))[-MAX_LOG_ROWS:][::-1]
-        for i, e in enumerate(logs):
-            time_str = e.get("timestamp") or ts_fmt(time.time())
+        # Tasks: rebuild only when the queue actually changed
+        tasks = list(mem.get("tasks", []))
+        if tasks != self._last_tasks:
+            self.tasks_list.delete(0, tk.END)
+            if tasks:
+                # Single Tcl round-trip instead of one insert per task
+                self.tasks_list.insert(tk.END, *tasks)
+            self._last_tasks = tasks
+        # Logs -> latest first; append only entries newer than the last seen
+        # timestamp to the ring (ISO timestamps compare lexicographically)
+        new_entries = [e for e in core.get_logs(mem)
+                       if str(e.get("timestamp", "")) > self._last_log_ts]
+        for e in new_entries:
+            self._log_ring.append(e)
+            time_str = e.get("timestamp_display") or e.get("timestamp") or ""
             task = str(e.get("task", ""))
-            result = str(e.get("output", ""))[:200].replace("\n", " ")
-            iid = f"row-{i}"
-            self.logs.insert("", "end", iid=iid, values=(time_str, task, result))
-            # Store full output in tags for detail view
-            self.logs.set(iid, column="result", value=result)
-            self.logs.item(iid, tags=(json.dumps(e),))
+            # Preview is computed once per entry, then reused on any repaint
+            result = e.get("_preview")
+            if result is None:
+                result = str(e.get("output", ""))[:200].translate(_NL_TO_SPACE)
+                e["_preview"] = result
+            iid = f"row-{self._row_seq}"
+            self._row_seq += 1
+            self.logs.insert("", 0, iid=iid, values=(time_str, task, result))
+            # Keep the full entry on the Python side for the detail view
+            self._row_payloads[iid] = e
+            self._log_ids.append(iid)
+        if new_entries:
+            self._last_log_ts = max(str(e.get("timestamp", "")) for e in new_entries)
+        # Trim the oldest rows so the widget stays bounded; the iid deque
+        # makes this O(overflow) instead of re-listing all children
+        while len(self._log_ids) > MAX_LOG_ROWS:
+            old = self._log_ids.popleft()
+            self.logs.delete(old)
+            self._row_payloads.pop(old, None)
 
     def _safe_load_memory(self) -> dict:
         try:
@@ -428,9 +552,8 @@ class AgentApp:
         self.refresh_views()
 
     def export_logs(self):
-        with self.lock:
-            mem = self._safe_load_memory()
-            logs = core.get_logs(mem)
+        mem = self._safe_load_memory()
+        logs = core.get_logs(mem)
         if not logs:
             messagebox.showinfo(TITLE_EXPORT, "No logs to export yet.")
             return
@@ -443,10 +566,14 @@ class AgentApp:
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                for e in logs:
-                    f.write(f"[{e.get('timestamp','')}] $ {e.get('task','')}\n")
-                    f.write((e.get('output','') or "") + "\n\n")
+            # Assemble the export in memory and issue a single write
+            buf = bytearray()
+            for e in logs:
+                buf += f"[{e.get('timestamp','')}] $ {e.get('task','')}\n".encode("utf-8")
+                buf += (e.get('output', '') or "").encode("utf-8")
+                buf += b"\n\n"
+            with open(path, "wb") as f:
+                f.write(buf)
             messagebox.showinfo(TITLE_EXPORT, f"Saved to {path}")
         except Exception as e:
             messagebox.showerror(TITLE_EXPORT, f"Failed to save: {e}")
@@ -456,24 +583,46 @@ class AgentApp:
         sel = self.logs.selection()
         if not sel:
             return
+        entry = self._row_payloads.get(sel[0], {})
+        detail = self._ensure_detail()
+        detail.delete("1.0", tk.END)
+        detail.insert(tk.END, entry.get("output", ""))
+
+    def _notify_mem_changed(self):
+        # Called from worker threads; event_generate with when="tail" is
+        # one of the few thread-safe Tk entry points
         try:
-            payload = self.logs.item(sel[0], "tags")[0]
-            entry = json.loads(payload)
-        except Exception:
-            entry = {}
-        self.detail.delete("1.0", tk.END)
-        self.detail.insert(tk.END, entry.get("output", ""))
+            self.root.event_generate("<<MemChanged>>", when="tail")
+        except tk.TclError:
+            pass
+
+    def _on_mem_changed(self, _event=None):
+        # Debounce: coalesce bursts of change events into one repaint
+        if self._pending_refresh is None:
+            self._pending_refresh = self.root.after(50, self._do_refresh)
+
+    def _do_refresh(self):
+        self._pending_refresh = None
+        self.refresh_views()
 
     def _poll_refresh(self):
-        # Periodically refresh views to reflect background activity
+        # Failsafe: apply the latest snapshot from the loader thread in case
+        # a change notification was missed (e.g. an external writer).
+        try:
+            mem = self._mem_q.get_nowait()
+        except queue.Empty:
+            mem = None
         try:
-            self.refresh_views()
+            if mem is not None:
+                self.refresh_views(mem)
         finally:
-            self.root.after(REFRESH_MS, self._poll_refresh)
+            self.root.after(FAILSAFE_MS, self._poll_refresh)
 
     def on_close(self):
         try:
+            core.set_on_change(None)
             self.stop_agent()
+            core.sync_memory()
         finally:
             self.root.destroy()
 
@@ -1,15 +1,72 @@
-import json, time, subprocess, os, tempfile, threading, shutil, shlex
+import atexit, copy, io, json, mmap, re, time, subprocess, os, tempfile, threading, shutil, shlex
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 MEMORY_FILE = "agent_memory.json"
+# Append-only NDJSON log; state/tasks stay in MEMORY_FILE. Appending a log
+# is one write syscall and reading the tail is O(rows displayed), not
+# O(total history).
+LOGS_FILE = "agent_logs.ndjson"
+# Upper bound for legacy logs still embedded in MEMORY_FILE; keeps each
+# state rewrite O(recent window) instead of O(total history).
+MAX_MEMORY_LOGS = 2000
 # Use a re-entrant lock to prevent deadlocks when helper functions
 # (e.g., load/save) are called while holding the lock.
 _MEM_LOCK = threading.RLock()
+# Signals waiting workers when a task is queued, so hosts can block on
+# arrival instead of polling on a fixed cadence.
+_TASK_CV = threading.Condition(_MEM_LOCK)
+# Coalesce fsyncs: durability-sync at most once per batch or interval
+# instead of on every save (per-operation fsync is the main I/O stall).
+# Memory is regenerable from the NDJSON log, so periodic fsync is opt-in;
+# sync_memory() still forces durability on shutdown.
+_FSYNC_ENABLED = os.environ.get("AGENT_FSYNC", "0") == "1"
+_FSYNC_BATCH = 10
+_FSYNC_INTERVAL_SEC = 30.0
+_pending_writes = 0
+_last_fsync = time.monotonic()
+# Parsed-memory cache keyed on (mtime_ns, size); steady-state reads cost an
+# os.stat instead of a JSON parse.
+_CACHE = {"stat": None, "data": None}
 try:
     from llm_client import call_llm  # optional
 except Exception:
     call_llm = None
 
+# Optional C-accelerated JSON for the hot memory read/write path
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps  # compact bytes
+except Exception:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+SHELL_TASK_TIMEOUT_SEC = 60
+# Cap what we decode/persist per task; a stray `grep -R` can emit hundreds
+# of MB and the log only ever shows a preview anyway
+MAX_OUTPUT_BYTES = 64 * 1024
+
+def _run_shell_task(task: str) -> str:
+    """Run a shell task with a hard timeout so a hung child can't wedge the loop."""
+    try:
+        r = subprocess.run(task, shell=True, capture_output=True,
+                           timeout=SHELL_TASK_TIMEOUT_SEC)
+        raw = r.stdout
+        if r.stderr:
+            raw += (b"\n[stderr]\n" if raw else b"[stderr]\n") + r.stderr
+        # Decode only the bounded prefix, not the whole capture
+        output = raw[:MAX_OUTPUT_BYTES].decode("utf-8", errors="replace")
+        if len(raw) > MAX_OUTPUT_BYTES:
+            output += "\n[truncated]"
+        return output.rstrip("\n")
+    except subprocess.TimeoutExpired:
+        return f"ERROR: command timed out after {SHELL_TASK_TIMEOUT_SEC}s"
+    except Exception as e:
+        return f"ERROR: {e}"
+
 def _is_rate_limited_error(err) -> bool:
     """Heuristic check for 429/rate limit errors coming from providers."""
     msg = str(err or "").lower()
@@ -22,9 +79,14 @@ def _normalize_memory(memory: dict) -> dict:
     - state: dict (coerce from legacy string -> {"mode": <str>})
     - logs: list
     - tasks: list
+
+    Already-normalized dicts are marked and returned as-is, so the many
+    defensive call sites cost one dict lookup instead of a full re-scan.
     """
     if not isinstance(memory, dict):
         memory = {}
+    elif memory.get("_normalized"):
+        return memory
     state = memory.get("state")
     if isinstance(state, str):
         memory["state"] = {"mode": state}
@@ -32,41 +94,121 @@ def _normalize_memory(memory: dict) -> dict:
         memory["state"] = {}
     if not isinstance(memory.get("logs"), list):
         memory["logs"] = []
+    elif len(memory["logs"]) > MAX_MEMORY_LOGS:
+        memory["logs"] = memory["logs"][-MAX_MEMORY_LOGS:]
     if not isinstance(memory.get("tasks"), list):
         memory["tasks"] = []
+    memory["_normalized"] = True
     return memory
 
 def load_memory():
     """Load memory with retries to tolerate concurrent writers."""
     if not os.path.exists(MEMORY_FILE):
         return {"logs": [], "state": {}, "tasks": []}
-    # Retry a few times if file is mid-write and JSON is invalid
-    for _ in range(5):
+    # Writes are atomic (os.replace), so parse errors are rare; retry with
+    # exponential backoff rather than burning a fixed 50ms per attempt
+    delay = 0.005
+    for _ in range(6):
         try:
             with _MEM_LOCK:
-                with open(MEMORY_FILE, "r") as f:
-                    data = json.load(f)
-            return _normalize_memory(data)
-        except json.JSONDecodeError:
-            time.sleep(0.05)
-        except FileNotFoundError:
-            time.sleep(0.02)
-    # Give up, return safe default but do not crash the UI
+                st = os.stat(MEMORY_FILE)
+                key = (st.st_mtime_ns, st.st_size)
+                if key == _CACHE["stat"] and _CACHE["data"] is not None:
+                    # Copy so caller mutations can't corrupt the cache
+                    return copy.deepcopy(_CACHE["data"])
+                with open(MEMORY_FILE, "rb") as f:
+                    if st.st_size > 0:
+                        # Zero-copy, demand-paged read of the cold file
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                        mv = memoryview(mm)
+                        try:
+                            try:
+                                # orjson parses the mapped pages in place
+                                data = _json_loads(mv)
+                            except TypeError:
+                                # stdlib json needs bytes
+                                data = _json_loads(mv.tobytes())
+                        finally:
+                            mv.release()
+                            mm.close()
+                    else:
+                        data = _json_loads(f.read())
+                if isinstance(data, dict):
+                    # Never honor a marker read back from disk
+                    data.pop("_normalized", None)
+                data = _normalize_memory(data)
+                _CACHE["stat"] = key
+                _CACHE["data"] = copy.deepcopy(data)
+            return data
+        except (ValueError, FileNotFoundError):
+            time.sleep(delay)
+            delay *= 2
+    # Give up, return safe default but do not crash the UI; history is
+    # still recoverable from the append-only NDJSON log
     return {"logs": [], "state": {}, "tasks": []}
 
+def _migrate_legacy_logs(memory):
+    """One-time move of logs embedded in MEMORY_FILE into the NDJSON journal.
+
+    After migration the state file holds only state + tasks, so every save
+    is O(state) instead of O(total history).
+    """
+    logs = memory.get("logs")
+    if not logs:
+        memory["logs"] = []
+        return
+    try:
+        seed = not os.path.exists(LOGS_FILE) or os.path.getsize(LOGS_FILE) == 0
+    except OSError:
+        seed = True
+    if seed:
+        payload = b"".join(_json_dumps(e) + b"\n" for e in logs if isinstance(e, dict))
+        fd = os.open(LOGS_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+    # Once the journal exists, embedded copies are stale duplicates
+    memory["logs"] = []
+
 def save_memory(memory):
-    """Atomically write memory to disk to avoid partial reads."""
+    """Atomically write state + tasks to disk; logs live in the NDJSON journal."""
     memory = _normalize_memory(memory)
+    _migrate_legacy_logs(memory)
     dirname = os.path.dirname(MEMORY_FILE) or "."
     os.makedirs(dirname, exist_ok=True)
+    # Serialize once, compact, and write with a single syscall instead of
+    # json.dump's many small indented writes. The memo marker is in-process
+    # only: persisting it would let a corrupted file skip re-normalization.
+    memory.pop("_normalized", None)
+    payload = _json_dumps(memory)
+    memory["_normalized"] = True
     with _MEM_LOCK:
+        global _pending_writes, _last_fsync
+        _pending_writes += 1
+        now = time.monotonic()
+        do_sync = _FSYNC_ENABLED and (
+            (_pending_writes >= _FSYNC_BATCH) or (now - _last_fsync > _FSYNC_INTERVAL_SEC)
+        )
+        _CACHE["stat"] = None  # invalidate while the write is in flight
         fd, tmp_path = tempfile.mkstemp(prefix=".mem.", dir=dirname)
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(memory, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
+            try:
+                os.write(fd, payload)
+                if do_sync:
+                    os.fsync(fd)
+                    _pending_writes = 0
+                    _last_fsync = now
+            finally:
+                os.close(fd)
             os.replace(tmp_path, MEMORY_FILE)
+            # Repopulate from the dict we just wrote; no re-read needed
+            try:
+                st = os.stat(MEMORY_FILE)
+                _CACHE["stat"] = (st.st_mtime_ns, st.st_size)
+                _CACHE["data"] = copy.deepcopy(memory)
+            except OSError:
+                pass
         finally:
             # If replace succeeded, tmp_path no longer exists; ignore failures
             try:
@@ -74,158 +216,265 @@ def save_memory(memory):
                     os.remove(tmp_path)
             except Exception:
                 pass
+    _fire_on_change()
 
-def inject_task(task, memory=None):
+# Optional change hook so a host UI can refresh on writes instead of polling
+_on_change = None
+
+def set_on_change(callback):
+    """Register a callable invoked after each successful memory write."""
+    global _on_change
+    _on_change = callback
+
+def _fire_on_change():
+    if _on_change is not None:
+        try:
+            _on_change()
+        except Exception:
+            pass
+
+def sync_memory():
+    """Force a durability sync of the memory file (call on shutdown)."""
+    global _pending_writes, _last_fsync
     with _MEM_LOCK:
+        try:
+            fd = os.open(MEMORY_FILE, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            _pending_writes = 0
+            _last_fsync = time.monotonic()
+        except OSError:
+            pass
+
+# Final durability sync for hosts that never call sync_memory themselves
+atexit.register(sync_memory)
+
+def inject_task(task, memory=None):
+    with _TASK_CV:
         memory = _normalize_memory(memory or load_memory())
         memory.setdefault("tasks", []).append(task)
         save_memory(memory)
+        _TASK_CV.notify_all()
+
+def inject_tasks(tasks, memory=None):
+    """Queue several tasks with a single load/save round-trip."""
+    tasks = [t for t in tasks if t]
+    if not tasks:
+        return
+    with _TASK_CV:
+        memory = _normalize_memory(memory or load_memory())
+        memory.setdefault("tasks", []).extend(tasks)
+        save_memory(memory)
+        _TASK_CV.notify_all()
+
+def wait_for_task(timeout=None):
+    """Block until a task is queued, a notify arrives, or timeout elapses.
+
+    Returns True if the queue is non-empty afterwards.
+    """
+    with _TASK_CV:
+        if _normalize_memory(load_memory()).get("tasks"):
+            return True
+        _TASK_CV.wait(timeout)
+        return bool(_normalize_memory(load_memory()).get("tasks"))
+
+def notify_tasks():
+    """Wake any thread blocked in wait_for_task (e.g. on shutdown)."""
+    with _TASK_CV:
+        _TASK_CV.notify_all()
+
+def _now_utc():
+    """Cheaper than datetime.now(tz): skips the per-call tz plumbing."""
+    return datetime.fromtimestamp(time.time(), timezone.utc)
+
+def _log_entry(task, output):
+    """Build a log entry; the display timestamp is formatted once here
+    rather than per-row on every UI repaint."""
+    now = _now_utc()
+    return {
+        "timestamp": now.isoformat(),
+        "timestamp_display": now.astimezone().strftime("%Y-%m-%d %H:%M:%S"),
+        "task": task,
+        "output": output,
+    }
 
-def get_logs(memory=None):
+def _append_log(entry):
+    """Append one log entry as a single NDJSON line."""
+    payload = _json_dumps(entry) + b"\n"
+    with _MEM_LOCK:
+        fd = os.open(LOGS_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+    _fire_on_change()
+
+def _tail_lines(path, max_lines):
+    """Read the last max_lines lines of path without loading the whole file."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            data = b""
+            while size > 0 and data.count(b"\n") <= max_lines:
+                step = min(64 * 1024, size)
+                size -= step
+                f.seek(size)
+                data = f.read(step) + data
+            return data.splitlines()[-max_lines:]
+    except OSError:
+        return []
+
+def get_logs(memory=None, max_rows=500):
+    entries = []
+    for line in _tail_lines(LOGS_FILE, max_rows):
+        try:
+            entries.append(_json_loads(line))
+        except ValueError:
+            continue
+    if entries:
+        return entries
+    # Legacy path: logs still embedded in agent_memory.json
     memory = _normalize_memory(memory or load_memory())
     return memory.get("logs", [])
 
 def execute_next_task(memory=None):
-    # Pop a task inside the lock
     with _MEM_LOCK:
         memory = _normalize_memory(memory or load_memory())
         tasks = memory.get("tasks", [])
         if not tasks:
             return None, memory
+        # Persist the pop before executing so a crash mid-task can't re-run
+        # it; mark it in flight for observability
         task = tasks.pop(0)
-        save_memory(memory)  # persist the pop immediately
-
-    # Skip code-fence markers or language-only fences accidentally enqueued
-    if _is_code_fence_only(task):
-        log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "task": task,
-            "output": "Skipped code fence marker/no-op.",
-        }
+        memory.setdefault("state", {})["in_flight"] = task
+        save_memory(memory)
+
+    # Execute outside the lock (can take time; holding _MEM_LOCK here would
+    # stall every memory reader for the task's full runtime)
+    if not (isinstance(task, str) and task.lower().startswith("llm:")):
+        # Shell command or fence no-op
+        if _is_code_fence_only(task):
+            output = "Skipped code fence marker/no-op."
+        else:
+            output = _run_shell_task(task)
+        log_entry = _log_entry(task, output)
+        _append_log(log_entry)
         with _MEM_LOCK:
             memory = _normalize_memory(load_memory())
-            memory.setdefault("logs", []).append(log_entry)
             memory.setdefault("state", {})
             memory["state"]["last_task"] = task
-            memory["state"]["last_output"] = log_entry["output"]
+            memory["state"]["last_output"] = output
+            memory["state"]["in_flight"] = None
             save_memory(memory)
         return log_entry, memory
 
-    # Execute outside the lock (can take time)
-    if task.startswith("llm:"):
-        prompt = task.split("llm:", 1)[1].strip()
-        if call_llm is None:
-            output = "ERROR: LLM not available. Install openai and set OPENAI_API_KEY."
-        else:
-            try:
-                # If the prompt is empty, interpret this as a quick "plan next steps" action.
-                if not prompt:
-                    mem_snapshot = load_memory()
-                    context = _recent_context(mem_snapshot, max_logs=15)
-                    planning_prompt = (
-                        "You are AGENT-i. Propose 1-5 concrete next steps as executable shell commands "
-                        "(bash on Ubuntu) or 'llm:' reasoning tasks.\n"
-                        "Return STRICT JSON only: {\"tasks\":[\"...\"]}.\n"
-                        "Avoid English sentences that are not commands.\n\n"
-                        "Context:\n" + context
+    prompt = task.split("llm:", 1)[1].strip()
+    if call_llm is None:
+        output = "ERROR: LLM not available. Install openai and set OPENAI_API_KEY."
+    else:
+        try:
+            # If the prompt is empty, interpret this as a quick "plan next steps" action.
+            if not prompt:
+                mem_snapshot = load_memory()
+                context = _recent_context(mem_snapshot, max_logs=15)
+                planning_prompt = (
+                    "You are AGENT-i. Propose 1-5 concrete next steps as executable shell commands "
+                    "(bash on Ubuntu) or 'llm:' reasoning tasks.\n"
+                    "Return STRICT JSON only: {\"tasks\":[\"...\"]}.\n"
+                    "Avoid English sentences that are not commands.\n\n"
+                    "Context:\n" + context
+                )
+                try:
+                    reply = call_llm(planning_prompt)
+                    suggestions = _safe_json_extract(reply)
+                    suggestions = _coerce_tasks(suggestions)
+                    inject_tasks(suggestions)
+                    output = (
+                        f"Planned {len(suggestions)} tasks:\n" + "\n".join(f"- {t}" for t in suggestions)
                     )
-                    try:
-                        reply = call_llm(planning_prompt)
-                        suggestions = _safe_json_extract(reply)
-                        suggestions = _coerce_tasks(suggestions)
-                        for t in suggestions:
-                            inject_task(t)
+                except Exception as e:
+                    if _is_rate_limited_error(e):
+                        suggestions = _coerce_tasks(_default_plan(prompt or None, max_new=5))
+                        inject_tasks(suggestions)
                         output = (
-                            f"Planned {len(suggestions)} tasks:\n" + "\n".join(f"- {t}" for t in suggestions)
+                            "LLM rate-limited. Planned offline steps:\n" + "\n".join(f"- {t}" for t in suggestions)
                         )
-                    except Exception as e:
-                        if _is_rate_limited_error(e):
-                            suggestions = _coerce_tasks(_default_plan(prompt or None, max_new=5))
-                            for t in suggestions:
-                                inject_task(t)
-                            output = (
-                                "LLM rate-limited. Planned offline steps:\n" + "\n".join(f"- {t}" for t in suggestions)
-                            )
-                        else:
-                            output = f"LLM planning error: {e}"
-                else:
-                    # Autonomous LLM task: ask for a concise answer AND concrete next steps to execute
-                    mem_snapshot = load_memory()
-                    context = _recent_context(mem_snapshot, max_logs=15)
-                    planning_prompt = (
-                        "You are AGENT-i, an autonomous local operator.\n"
-                        "Task: " + prompt + "\n\n"
-                        "Context:\n" + context + "\n\n"
-                        "Respond in STRICT JSON only with keys 'answer' and 'tasks':\n"
-                        "{\n  \"answer\": \"short guidance\",\n  \"tasks\": [\"cmd or llm: ...\"]\n}\n"
-                        "Rules:\n- tasks must be exact Ubuntu bash commands or start with 'llm:'.\n- 1 to 5 tasks max.\n- Prefer actionable steps to inspect and modify local files when relevant."
-                    )
-                    try:
-                        reply = call_llm(planning_prompt)
-                        ans, sugg = _extract_answer_and_tasks(reply)
-                        sugg = _coerce_tasks(sugg)
-                        for t in sugg:
-                            inject_task(t)
-                        if ans and sugg:
-                            output = ans.strip() + "\n\n" + (
-                                f"Planned {len(sugg)} tasks:\n" + "\n".join(f"- {t}" for t in sugg)
-                            )
-                        elif ans:
-                            output = ans.strip()
-                        elif sugg:
-                            output = (
-                                f"Planned {len(sugg)} tasks:\n" + "\n".join(f"- {t}" for t in sugg)
-                            )
-                        else:
-                            output = (reply or "").strip()
-                    except Exception as e:
-                        if _is_rate_limited_error(e):
-                            sugg = _coerce_tasks(_default_plan(prompt, max_new=5))
-                            for t in sugg:
-                                inject_task(t)
-                            output = (
-                                "LLM rate-limited. Planned offline steps:\n" + "\n".join(f"- {t}" for t in sugg)
-                            )
-                        else:
-                            # Fall back to raw answer or error
-                            try:
-                                output = call_llm(prompt)
-                            except Exception as e2:
-                                output = f"LLM Error: {e2}"
-            except Exception as e:
-                output = f"LLM Error: {e}"
-    else:
-        try:
-            output = subprocess.getoutput(task)
+                    else:
+                        output = f"LLM planning error: {e}"
+            else:
+                # Autonomous LLM task: ask for a concise answer AND concrete next steps to execute
+                mem_snapshot = load_memory()
+                context = _recent_context(mem_snapshot, max_logs=15)
+                planning_prompt = (
+                    "You are AGENT-i, an autonomous local operator.\n"
+                    "Task: " + prompt + "\n\n"
+                    "Context:\n" + context + "\n\n"
+                    "Respond in STRICT JSON only with keys 'answer' and 'tasks':\n"
+                    "{\n  \"answer\": \"short guidance\",\n  \"tasks\": [\"cmd or llm: ...\"]\n}\n"
+                    "Rules:\n- tasks must be exact Ubuntu bash commands or start with 'llm:'.\n- 1 to 5 tasks max.\n- Prefer actionable steps to inspect and modify local files when relevant."
+                )
+                try:
+                    reply = call_llm(planning_prompt)
+                    ans, sugg = _extract_answer_and_tasks(reply)
+                    sugg = _coerce_tasks(sugg)
+                    inject_tasks(sugg)
+                    if ans and sugg:
+                        output = ans.strip() + "\n\n" + (
+                            f"Planned {len(sugg)} tasks:\n" + "\n".join(f"- {t}" for t in sugg)
+                        )
+                    elif ans:
+                        output = ans.strip()
+                    elif sugg:
+                        output = (
+                            f"Planned {len(sugg)} tasks:\n" + "\n".join(f"- {t}" for t in sugg)
+                        )
+                    else:
+                        output = (reply or "").strip()
+                except Exception as e:
+                    if _is_rate_limited_error(e):
+                        sugg = _coerce_tasks(_default_plan(prompt, max_new=5))
+                        inject_tasks(sugg)
+                        output = (
+                            "LLM rate-limited. Planned offline steps:\n" + "\n".join(f"- {t}" for t in sugg)
+                        )
+                    else:
+                        # Fall back to raw answer or error
+                        try:
+                            output = call_llm(prompt)
+                        except Exception as e2:
+                            output = f"LLM Error: {e2}"
         except Exception as e:
-            output = f"ERROR: {e}"
+            output = f"LLM Error: {e}"
 
-    log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "task": task,
-        "output": output,
-    }
+    log_entry = _log_entry(task, output)
 
-    # Commit results inside the lock
+    # Commit results: log goes to the append-only file, state to memory
+    _append_log(log_entry)
     with _MEM_LOCK:
         memory = _normalize_memory(load_memory())
-        memory.setdefault("logs", []).append(log_entry)
         memory.setdefault("state", {})
         memory["state"]["last_task"] = task
         memory["state"]["last_output"] = output
+        memory["state"]["in_flight"] = None
         save_memory(memory)
     return log_entry, memory
 
 def _extract_answer_and_tasks(text: str) -> tuple[str, list[str]]:
     """Parse a JSON object with 'answer' and 'tasks'. On failure, fall back heuristics."""
-    try:
-        data = json.loads(text)
-        ans = str(data.get("answer", "") or "").strip()
-        tasks = data.get("tasks")
-        if isinstance(tasks, list):
-            return ans, [str(x).strip() for x in tasks if str(x).strip()]
-    except Exception:
-        pass
+    # Only attempt a parse when the reply can actually be JSON; plain-text
+    # replies skip the raise/catch round-trip entirely
+    if (text or "").lstrip()[:1] == "{":
+        try:
+            data = json.loads(text)
+            ans = str(data.get("answer", "") or "").strip()
+            tasks = data.get("tasks")
+            if isinstance(tasks, list):
+                return ans, [str(x).strip() for x in tasks if str(x).strip()]
+        except Exception:
+            pass
     # Fallback: derive tasks using the existing heuristic and use full text as answer
     return (text or "").strip(), _safe_json_extract(text)
 
@@ -241,37 +490,48 @@ def run_autonomous_loop(delay=2):
 def _recent_context(memory: dict, max_logs: int = 10) -> str:
     """Build a compact textual context from recent logs and state."""
     memory = _normalize_memory(memory)
-    logs = (memory.get("logs") or [])[-max_logs:]
+    logs = get_logs(memory, max_rows=max_logs)
     state = memory.get("state", {})
-    parts = [
-        f"MODE: {state.get('mode', 'unknown')}",
-        f"LAST_TASK: {state.get('last_task', '-')}",
-    ]
+    # Write straight into one buffer; no per-entry concat or list + join
+    buf = io.StringIO()
+    buf.write(f"MODE: {state.get('mode', 'unknown')}\n")
+    buf.write(f"LAST_TASK: {state.get('last_task', '-')}")
     for e in logs:
-        ts = e.get("timestamp", "")
-        t = e.get("task", "")
         out = (e.get("output", "") or "").strip()
+        buf.write(f"\n[{e.get('timestamp', '')}] $ {e.get('task', '')}\n")
+        buf.write(out[:300])
         if len(out) > 300:
-            out = out[:300] + "..."
-        parts.append(f"[{ts}] $ {t}\n{out}")
-    return "\n".join(parts)
+            buf.write("...")
+    return buf.getvalue()
 
 
 def _safe_json_extract(text: str):
     """Try to parse a JSON object with a 'tasks' array from text; fallback to list heuristics."""
-    try:
-        data = json.loads(text)
-        tasks = data.get("tasks")
-        if isinstance(tasks, list):
-            return [str(x).strip() for x in tasks if str(x).strip()]
-    except Exception:
-        pass
+    if (text or "").lstrip()[:1] == "{":
+        try:
+            data = json.loads(text)
+            tasks = data.get("tasks")
+            if isinstance(tasks, list):
+                return [str(x).strip() for x in tasks if str(x).strip()]
+        except Exception:
+            pass
     # Heuristic: take lines that look like list items
     lines = [l.strip("- •* \t") for l in (text or "").splitlines()]
     tasks = [l for l in lines if l]
     return tasks[:5]
 
 
+# One compiled scan for pipeline/compound syntax instead of chained `in` checks
+_SHELL_META_RE = re.compile(r"&&|\|\||[|;<>`$]")
+_BUILTINS = frozenset({"echo", "cd", "exit", "true", "false", "test", "[", "]", "printf", "pwd", "export", "set", "unset", "eval"})
+
+
+@lru_cache(maxsize=256)
+def _which(cmd: str):
+    """PATH lookups stat every PATH dir; cache them for the process lifetime."""
+    return shutil.which(cmd)
+
+
 def _is_shell_command(s: str) -> bool:
     """Heuristic: does this look like an executable shell command?"""
     s = (s or "").strip()
@@ -280,22 +540,25 @@ def _is_shell_command(s: str) -> bool:
     if s.lower().startswith("llm:"):
         return False
     # Obvious shell syntax implies a command pipeline/compound
-    if any(sym in s for sym in ["|", ";", "&&", "||", ">", "<", "$(`", "`", "$("]):
+    if _SHELL_META_RE.search(s):
         return True
-    try:
-        parts = shlex.split(s)
-        if not parts:
-            return False
-        first = parts[0]
-    except Exception:
-        first = s.split()[0]
-    builtins = {"echo", "cd", "exit", "true", "false", "test", "[", "]", "printf", "pwd", "export", "set", "unset", "eval"}
-    if first in builtins:
+    if " " not in s and "\t" not in s:
+        # Single token: no need to run shlex's char-by-char tokenizer
+        first = s
+    else:
+        try:
+            parts = shlex.split(s)
+            if not parts:
+                return False
+            first = parts[0]
+        except Exception:
+            first = s.split()[0]
+    if first in _BUILTINS:
         return True
     # variable assignment like FOO=bar make may precede a command; treat as possibly valid
     if "=" in first and not first.startswith(("http://", "https://")):
         return True
-    return shutil.which(first) is not None
+    return _which(first) is not None
 
 
 def _coerce_tasks(tasks: list[str]) -> list[str]:
@@ -388,7 +651,8 @@ def reflect_on_last_output() -> list[str]:
         return []
     with _MEM_LOCK:
         mem = load_memory()
-    last = (mem.get("logs") or [])[-1] if mem.get("logs") else None
+    logs = get_logs(mem, max_rows=1)
+    last = logs[-1] if logs else None
     if not last:
         return []
     prompt = (
@@ -454,8 +718,7 @@ def autonomy_cycle(goal: str | None = None, max_steps: int = 10, interval: float
             mem = load_memory()
             queue_empty = not mem.get("tasks")
         if enable_chaining and queue_empty:
-            for t in plan_tasks_with_llm(goal):
-                inject_task(t)
+            inject_tasks(plan_tasks_with_llm(goal))
 
         # Execute one
         execute_next_task()
@@ -463,8 +726,7 @@ def autonomy_cycle(goal: str | None = None, max_steps: int = 10, interval: float
 
         # Reflect and chain more
         if enable_reflection:
-            for t in (reflect_on_last_output() or [])[:3]:
-                inject_task(t)
+            inject_tasks((reflect_on_last_output() or [])[:3])
 
         # Periodic synthesis
         if enable_synthesis_every and steps % enable_synthesis_every == 0:
@@ -473,6 +735,12 @@ def autonomy_cycle(goal: str | None = None, max_steps: int = 10, interval: float
         time.sleep(interval)
 
 
+# Background workers for the LLM stages of full_autonomy_loop, so planning
+# and reflection calls overlap with shell execution instead of serializing
+# the whole iteration behind 1-30s of network latency.
+_LLM_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm")
+
+
 def full_autonomy_loop(interval: float = 1.0, goal: str | None = None, should_continue=None,
                        enable_reflection: bool = True, enable_synthesis_every: int = 5):
     """Continuously plan -> execute -> reflect -> synthesize until should_continue() returns False.
@@ -481,6 +749,8 @@ def full_autonomy_loop(interval: float = 1.0, goal: str | None = None, should_co
     Sets state.mode = 'full_auto'.
     """
     steps = 0
+    plan_fut = None
+    reflect_fut = None
     with _MEM_LOCK:
         mem = load_memory()
         mem.setdefault("state", {})["mode"] = "full_auto"
@@ -492,22 +762,35 @@ def full_autonomy_loop(interval: float = 1.0, goal: str | None = None, should_co
         if callable(should_continue) and not should_continue():
             break
 
-        # Plan if queue empty
+        # Drain the previous iteration's reflection, if it finished
+        if reflect_fut is not None and reflect_fut.done():
+            try:
+                inject_tasks((reflect_fut.result() or [])[:3])
+            except Exception:
+                pass
+            reflect_fut = None
+
+        # Kick off planning in the background while the queue still has work;
+        # only block on the result once the queue actually runs dry
         with _MEM_LOCK:
             mem = load_memory()
-            queue_empty = not mem.get("tasks")
-        if queue_empty:
-            for t in plan_tasks_with_llm(goal):
-                inject_task(t)
+            remaining = len(mem.get("tasks") or [])
+        if remaining <= 1 and plan_fut is None:
+            plan_fut = _LLM_EXEC.submit(plan_tasks_with_llm, goal)
+        if plan_fut is not None and (remaining == 0 or plan_fut.done()):
+            try:
+                inject_tasks(plan_fut.result() or [])
+            except Exception:
+                pass
+            plan_fut = None
 
         # Execute one
         execute_next_task()
         steps += 1
 
-        # Reflect and chain more
-        if enable_reflection:
-            for t in (reflect_on_last_output() or [])[:3]:
-                inject_task(t)
+        # Reflect in the background; results are injected next iteration
+        if enable_reflection and reflect_fut is None:
+            reflect_fut = _LLM_EXEC.submit(reflect_on_last_output)
 
         # Periodic synthesis
         if enable_synthesis_every and steps % enable_synthesis_every == 0:
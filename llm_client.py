@@ -9,7 +9,15 @@ def _is_rate_error(err: Exception) -> bool:
     msg = str(err or "").lower()
     return ("rate limit" in msg) or ("429" in msg) or ("rate_limit_exceeded" in msg) or ("rpd" in msg)
 
+_ENV_LOADED = False
+
 def _load_env_if_available():
+    # One-shot: re-importing dotenv and re-parsing .env on every call_llm
+    # is pure overhead once the environment is populated
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     try:
         from dotenv import load_dotenv  # type: ignore
         load_dotenv()
@@ -18,6 +26,32 @@ def _load_env_if_available():
         pass
 
 
+# Reused OpenAI client: constructing one per call sets up a fresh HTTP
+# connection pool (DNS + TCP + TLS) each time
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+def _get_client(api_key: str):
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                from openai import OpenAI  # type: ignore
+                kwargs = {"api_key": api_key, "timeout": 30.0}  # 30 second timeout
+                try:
+                    # Explicit keep-alive pool so retries and the tight
+                    # autonomy loops reuse warm TLS connections
+                    import httpx  # type: ignore
+                    kwargs["http_client"] = httpx.Client(
+                        timeout=30.0,
+                        limits=httpx.Limits(max_keepalive_connections=10),
+                    )
+                except Exception:
+                    pass
+                _CLIENT = OpenAI(**kwargs)
+    return _CLIENT
+
+
 def call_llm(prompt: str, model: str | None = None) -> str:
     """Call an OpenAI chat model with a simple system+user prompt.
 
@@ -45,8 +79,7 @@ def call_llm(prompt: str, model: str | None = None) -> str:
 
     # Prefer new SDK interface if available
     try:
-        from openai import OpenAI  # type: ignore
-        client = OpenAI(api_key=api_key, timeout=30.0)  # 30 second timeout
+        client = _get_client(api_key)
         model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         messages = [
             {"role": "system", "content": (
@@ -1,37 +1,80 @@
+import atexit
 import json
 import os
+import tempfile
+import time
+from collections import deque
 from datetime import datetime, timezone
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
-LOG_FILE = os.path.join(ROOT_DIR, "memory", "command_log.json")
+LOG_FILE = os.path.join(ROOT_DIR, "memory", "command_log.jsonl")
 MEM_FILE = os.path.join(ROOT_DIR, "memory", "memory.json")
 
+# Optional C-accelerated JSON for the per-command log path
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps  # compact bytes
+except Exception:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# In-process ring for the last-100 memory file: hydrated from disk once,
+# flushed every _FLUSH_EVERY writes (and at exit) instead of a full
+# read/trim/rewrite per command.
+_MEM_CACHE: deque | None = None
+_DIRTY_COUNT = 0
+_FLUSH_EVERY = 10
+
+
+def _load_mem_cache() -> deque:
+    global _MEM_CACHE
+    if _MEM_CACHE is None:
+        try:
+            with open(MEM_FILE, "rb") as f:
+                items = _json_loads(f.read())
+        except (OSError, ValueError):
+            items = []
+        _MEM_CACHE = deque(items, maxlen=100)
+    return _MEM_CACHE
+
+
+def _flush_mem():
+    global _DIRTY_COUNT
+    if _MEM_CACHE is None or _DIRTY_COUNT == 0:
+        return
+    dirname = os.path.dirname(MEM_FILE)
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+    try:
+        os.write(fd, _json_dumps(list(_MEM_CACHE)))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, MEM_FILE)
+    _DIRTY_COUNT = 0
+
+
+atexit.register(_flush_mem)
+
 def log_memory(cmd, result):
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        # fromtimestamp skips the tz plumbing datetime.now(tz) pays per call
+        "timestamp": datetime.fromtimestamp(time.time(), timezone.utc).isoformat(),
         "command": cmd,
         "output": result
     }
 
-    # Ensure log file exists
-    if not os.path.exists(LOG_FILE):
-        os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-        with open(LOG_FILE, "w") as f:
-            json.dump([], f)
-
-    with open(LOG_FILE, "r") as f:
-        logs = json.load(f)
-    logs.append(entry)
-    with open(LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=2)
-
-    # also store to memory.json (trim to last 100)
-    if not os.path.exists(MEM_FILE):
-        with open(MEM_FILE, "w") as f:
-            json.dump([], f)
-    with open(MEM_FILE, "r") as f:
-        memory = json.load(f)
-    memory.append(entry)
-    memory = memory[-100:]
-    with open(MEM_FILE, "w") as f:
-        json.dump(memory, f, indent=2)
+    # Append-only journal: one JSON line per command, O(1) per write
+    # instead of rewriting the whole history each time.
+    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+    with open(LOG_FILE, "ab") as f:
+        f.write(_json_dumps(entry) + b"\n")
+
+    # also store to memory.json (ring of last 100, flushed periodically)
+    global _DIRTY_COUNT
+    _load_mem_cache().append(entry)
+    _DIRTY_COUNT += 1
+    if _DIRTY_COUNT >= _FLUSH_EVERY:
+        _flush_mem()
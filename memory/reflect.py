@@ -1,20 +1,60 @@
 import json
+import time
 from datetime import datetime, timezone
-from transformers import pipeline
 
 MEM_FILE = "memory/memory.json"
 SCORE_FILE = "memory/score.json"
 
-summarizer = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6")
+# Optional C-accelerated JSON, matching the rest of the tree
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps  # compact bytes
+except Exception:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# Lazy singleton: the ~450MB summarizer loads on first use, not at import,
+# so interpreters that never reflect skip the cost entirely.
+_SUMM = None
+
+def _summarizer():
+    global _SUMM
+    if _SUMM is None:
+        from transformers import pipeline
+        try:
+            import torch
+            device = 0 if torch.cuda.is_available() else -1
+        except Exception:
+            device = -1
+        _SUMM = pipeline("summarization", model="sshleifer/distilbart-cnn-12-6", device=device)
+    return _SUMM
 
 def reflect_and_score():
-    with open(MEM_FILE, "r") as f:
-        mem = json.load(f)
+    # The logger batches writes, so flush its ring first: otherwise the
+    # file may not exist yet on a fresh install, and up to 9 of the most
+    # recent entries would be missing from the reflection window.
+    try:
+        from logger import _flush_mem
+        _flush_mem()
+    except Exception:
+        pass
+    with open(MEM_FILE, "rb") as f:
+        mem = _json_loads(f.read())
 
-    summary = summarizer(" ".join([m["command"] + ": " + m["output"] for m in mem[-10:]]), max_length=100, min_length=30, do_sample=False)[0]["summary_text"]
+    text = " ".join([m["command"] + ": " + m["output"] for m in mem[-10:]])
+    try:
+        import torch
+        ctx = torch.inference_mode()
+    except Exception:
+        import contextlib
+        ctx = contextlib.nullcontext()
+    with ctx:
+        summary = _summarizer()(text, max_length=100, min_length=30, do_sample=False)[0]["summary_text"]
 
     score_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.fromtimestamp(time.time(), timezone.utc).isoformat(),
         "summary": summary,
         "score": {
             "success_rate": estimate_success(mem),
@@ -22,8 +62,8 @@ def reflect_and_score():
         }
     }
 
-    with open(SCORE_FILE, "a") as f:
-        f.write(json.dumps(score_entry) + "\n")
+    with open(SCORE_FILE, "ab") as f:
+        f.write(_json_dumps(score_entry) + b"\n")
 
     return score_entry
 
@@ -2,19 +2,93 @@ import json
 import os
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
-QUEUE_FILE = os.path.join(ROOT_DIR, "command_queue.json")
+# Append-only queue: enqueue appends one JSON line, dequeue advances a
+# byte offset in the sidecar head file. No full-array load/rewrite per
+# command. The legacy command_queue.json array is drained on first read.
+QUEUE_FILE = os.path.join(ROOT_DIR, "command_queue.jsonl")
+HEAD_FILE = os.path.join(ROOT_DIR, "command_queue.head")
+LEGACY_QUEUE_FILE = os.path.join(ROOT_DIR, "command_queue.json")
+# Rewrite the file once this much consumed prefix accumulates
+_COMPACT_BYTES = 64 * 1024
+
+# Optional C-accelerated JSON; the queue is polled every loop tick
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps  # compact bytes
+except Exception:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def add_command(cmd):
+    """Enqueue one command: a single O(1) append."""
+    with open(QUEUE_FILE, "ab") as f:
+        f.write(_json_dumps(cmd) + b"\n")
+
+
+def _read_head():
+    try:
+        with open(HEAD_FILE, "r") as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_head(offset):
+    tmp = HEAD_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(str(offset))
+    os.replace(tmp, HEAD_FILE)
+
+
+def _drain_legacy():
+    """Move any entries from the old JSON-array queue into the JSONL file."""
+    if not os.path.exists(LEGACY_QUEUE_FILE):
+        return
+    try:
+        with open(LEGACY_QUEUE_FILE, "rb") as f:
+            queue = _json_loads(f.read())
+    except Exception:
+        queue = []
+    if queue:
+        with open(QUEUE_FILE, "ab") as f:
+            for cmd in queue:
+                f.write(_json_dumps(cmd) + b"\n")
+    os.remove(LEGACY_QUEUE_FILE)
+
+
+def _compact(remainder):
+    """Drop the consumed prefix: rewrite the unread tail and reset the head."""
+    tmp = QUEUE_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(remainder)
+    os.replace(tmp, QUEUE_FILE)
+    _write_head(0)
+
 
 def get_next_command():
+    _drain_legacy()
     if not os.path.exists(QUEUE_FILE):
         return None
-    with open(QUEUE_FILE, "r") as f:
-        try:
-            queue = json.load(f)
-            if not queue:
-                return None
-            cmd = queue.pop(0)
-            with open(QUEUE_FILE, "w") as out:
-                json.dump(queue, out, indent=2)
-            return cmd
-        except Exception:
+    head = _read_head()
+    with open(QUEUE_FILE, "rb") as f:
+        f.seek(head)
+        line = f.readline()
+        if not line.strip():
+            # Fully consumed; shrink the file instead of growing forever
+            if head:
+                _compact(b"")
             return None
+        new_head = f.tell()
+        remainder = f.read() if new_head >= _COMPACT_BYTES else None
+    try:
+        cmd = _json_loads(line)
+    except Exception:
+        cmd = None
+    if remainder is not None:
+        _compact(remainder)
+    else:
+        _write_head(new_head)
+    return cmd
@@ -1,12 +1,16 @@
 import tkinter as tk
 import json
 import os
+import sys
 from tkinter import scrolledtext
 
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+from queue_handler import add_command
+
 MEMORY_FILE = os.path.join(ROOT_DIR, "agent_memory.json")
 MODE_FILE = os.path.join(ROOT_DIR, "mode_flag.json")
-QUEUE_FILE = os.path.join(ROOT_DIR, "command_queue.json")
 
 def read_file(path):
     if os.path.exists(path):
@@ -16,17 +20,11 @@ def read_file(path):
 
 def write_mode(mode):
     with open(MODE_FILE, "w") as f:
-        json.dump({"mode": mode}, f)
+        json.dump({"mode": mode}, f, separators=(",", ":"))
 
 def add_command_to_queue(cmd):
-    if os.path.exists(QUEUE_FILE):
-        with open(QUEUE_FILE) as f:
-            queue = json.load(f)
-    else:
-        queue = []
-    queue.append(cmd)
-    with open(QUEUE_FILE, "w") as f:
-        json.dump(queue, f, indent=2)
+    # O(1) append to the JSONL queue; no full-array rewrite
+    add_command(cmd)
 
 def launch_ui():
     root = tk.Tk()
@@ -62,13 +60,33 @@ def launch_ui():
     mem_box = scrolledtext.ScrolledText(root, height=20, width=100)
     mem_box.pack()
 
+    # Skip reparsing on timer ticks when the file hasn't changed
+    mem_state = {"mtime": 0}
+
     def update_memory():
-        if os.path.exists(MEMORY_FILE):
-            with open(MEMORY_FILE) as f:
-                memory = json.load(f)
-                mem_box.delete(1.0, tk.END)
-                for item in memory.get("history", [])[-20:]:
-                    mem_box.insert(tk.END, f"> {item['command']}\n{item['result'][:300]}\n\n")
+        try:
+            st = os.stat(MEMORY_FILE)
+        except OSError:
+            root.after(3000, update_memory)
+            return
+        if st.st_mtime == mem_state["mtime"]:
+            root.after(3000, update_memory)
+            return
+        # One exact-size raw read, one parse
+        fd = os.open(MEMORY_FILE, os.O_RDONLY)
+        try:
+            data = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        try:
+            memory = json.loads(data)
+        except ValueError:
+            root.after(3000, update_memory)
+            return
+        mem_state["mtime"] = st.st_mtime
+        mem_box.delete(1.0, tk.END)
+        for item in memory.get("history", [])[-20:]:
+            mem_box.insert(tk.END, f"> {item['command']}\n{item['result'][:300]}\n\n")
         root.after(3000, update_memory)
 
     update_memory()
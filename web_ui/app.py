@@ -1,17 +1,31 @@
 import os
-import threading
+import tempfile
 from flask import Flask
 
-from .routes import bp
-
 
 def create_app() -> Flask:
+    # Imported here so `import web_ui.app` stays cheap: routes pulls in the
+    # whole autonomy_core chain, which CLI utilities don't need
+    from .routes import bp
+
     app = Flask(__name__)
     app.register_blueprint(bp)
+    # Templates don't change at runtime: skip the per-request staleness
+    # check and persist compiled templates across restarts
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+    try:
+        from jinja2 import FileSystemBytecodeCache
+        cache_dir = os.path.join(tempfile.gettempdir(), "agenti_jinja_cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    except Exception:
+        pass
     return app
 
 
 if __name__ == "__main__":
     app = create_app()
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=True, use_reloader=False)
+    debug = os.environ.get("FLASK_DEBUG", "0") == "1"
+    app.run(host="0.0.0.0", port=port, debug=debug, use_reloader=False)
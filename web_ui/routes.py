@@ -1,7 +1,10 @@
+import functools
 import os
+import queue
+import re
 import sys
 import threading
-from flask import Blueprint, render_template, request, redirect, url_for, jsonify
+from flask import Blueprint, Response, render_template, request, redirect, url_for, jsonify
 
 # Ensure root on path
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -10,23 +13,66 @@ if ROOT not in sys.path:
 
 import autonomy_core as core
 
+# Resolved once at import; keeps the try/except out of the request path
+_call_llm = core.call_llm
+
 bp = Blueprint('web', __name__)
 
+# One compiled scan instead of several substring passes per error
+_RATE_LIMIT_RE = re.compile(r"rate[ _-]?limit|429|rpd", re.I)
+
 _agent_thread = None
 _stop_event = threading.Event()
-_auto_thread = None
-_full_auto_thread = None
+
+# One long-lived worker consumes autonomy jobs; repeated clicks report
+# 'busy' instead of racing fresh threads against _stop_event.
+_auto_queue: queue.Queue = queue.Queue(maxsize=1)
+_auto_busy = threading.Event()
+
+
+def _auto_worker():
+    while True:
+        job = _auto_queue.get()
+        _auto_busy.set()
+        try:
+            job()
+        except Exception as e:
+            print(f"Error in autonomy job: {e}")
+        finally:
+            _auto_busy.clear()
+            _auto_queue.task_done()
+
+
+threading.Thread(target=_auto_worker, daemon=True, name="auto-worker").start()
+
+# Change notification for SSE clients: core fires the hook on every memory
+# write; each client tracks the generation it last saw, so one slow client
+# can't starve the others.
+_mem_cond = threading.Condition()
+_mem_gen = 0
+
+
+def _on_mem_write():
+    global _mem_gen
+    with _mem_cond:
+        _mem_gen += 1
+        _mem_cond.notify_all()
+
+
+core.set_on_change(_on_mem_write)
 
 
 def _agent_loop():
     while not _stop_event.is_set():
         try:
-            core.execute_next_task()
+            # Block on the core's task condition: inject_task wakes us
+            # immediately, so queued work no longer waits out a poll tick
+            if core.wait_for_task(timeout=30):
+                core.execute_next_task()
         except Exception as e:
             print(f"Error in agent loop: {e}")
             # Continue running even if one task fails
-        # small sleep to prevent tight loop; core pacing can be adjusted separately
-        _stop_event.wait(2)
+            _stop_event.wait(2)
 
 
 def start_background_agent():
@@ -39,6 +85,9 @@ def start_background_agent():
     try:
         mem = core.load_memory()
         if isinstance(mem.get('state'), dict):
+            # Skip the rewrite on redundant start presses
+            if mem['state'].get('mode') == 'autonomous':
+                return
             mem['state']['mode'] = 'autonomous'
         else:
             mem['state'] = {'mode': 'autonomous'}
@@ -49,9 +98,13 @@ def start_background_agent():
 
 def stop_background_agent():
     _stop_event.set()
+    # Wake the loop out of wait_for_task so it sees the stop promptly
+    core.notify_tasks()
     try:
         mem = core.load_memory()
         if isinstance(mem.get('state'), dict):
+            if mem['state'].get('mode') == 'stopped':
+                return
             mem['state']['mode'] = 'stopped'
         else:
             mem['state'] = {'mode': 'stopped'}
@@ -75,14 +128,75 @@ def _start_autonomy_cycle(goal: str | None, steps: int):
         print(f"Error in autonomy_cycle: {e}")
 
 
+# Agent re-queues resubmit identical task strings; memoize the heuristics
+# so repeats skip the tokenizer/PATH work entirely
+@functools.lru_cache(maxsize=1024)
+def _cached_is_cmd(task: str) -> bool:
+    fn = getattr(core, "_is_shell_command", None)
+    return bool(callable(fn) and fn(task))
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_is_fence(task: str) -> bool:
+    fn = getattr(core, "_is_code_fence_only", None)
+    return bool(callable(fn) and fn(task))
+
+
 def _safe_logs(logs):
-    safe = []
-    for e in logs or []:
-        if isinstance(e, dict):
-            safe.append(e)
-        else:
-            safe.append({"timestamp": "", "task": "", "output": str(e)})
-    return safe
+    # type() is an exact C-level check; entries are plain dicts in practice
+    return [e if type(e) is dict else {"timestamp": "", "task": "", "output": str(e)}
+            for e in (logs or ())]
+
+
+# Rendered-tail cache: idle polls hit the same journal bytes, so keep the
+# last sanitized newest-first slice keyed on the journal's stat.
+_log_cache = {"key": None, "rows": []}
+
+
+# Rendered-page cache for the two idle-polled routes: while neither the
+# state file nor the journal changed, serve the previous HTML without
+# touching Jinja. One entry per route.
+_page_cache: dict[str, tuple[tuple, str]] = {}
+
+
+def _page_key():
+    key = []
+    for p in (core.MEMORY_FILE, core.LOGS_FILE):
+        try:
+            st = os.stat(p)
+            key.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+def _render_cached(route, template):
+    key = _page_key()
+    hit = _page_cache.get(route)
+    if hit is not None and hit[0] == key:
+        return Response(hit[1], mimetype='text/html')
+    try:
+        mem = core.load_memory()
+        logs = _log_tail(mem)
+    except Exception:
+        mem, logs = {"tasks": [], "logs": [], "state": {}}, []
+    body = render_template(template, mem=mem, logs=logs)
+    _page_cache[route] = (key, body)
+    return Response(body, mimetype='text/html')
+
+
+def _log_tail(mem):
+    try:
+        st = os.stat(core.LOGS_FILE)
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    if key is not None and key == _log_cache["key"]:
+        return _log_cache["rows"]
+    rows = _safe_logs(core.get_logs(mem, max_rows=200))[::-1]
+    _log_cache["key"] = key
+    _log_cache["rows"] = rows
+    return rows
 
 
 @bp.post('/ask')
@@ -92,14 +206,8 @@ def ask_ai():
     if not question:
         return render_template('partials/ask_panel.html', question='', answer='Please enter a question.', suggestions=[])
 
-    # Try to import call_llm from core; may be None if not configured
-    try:
-        from autonomy_core import call_llm  # type: ignore
-    except Exception:
-        call_llm = None
-
-    # Build an answer
-    if call_llm is None:
+    # Build an answer (_call_llm may be None if the SDK is not configured)
+    if _call_llm is None:
         answer = "LLM not available. Set OPENAI_API_KEY and ensure the OpenAI SDK is installed."
     else:
         try:
@@ -110,10 +218,9 @@ def ask_ai():
                 "Make the guidance short.\n\n"
                 f"User question: {question}\n"
             )
-            answer = call_llm(prompt)
+            answer = _call_llm(prompt)
         except Exception as e:
-            msg = str(e).lower()
-            if any(s in msg for s in ["rate limit", "429", "rate_limit_exceeded", "rpd"]):
+            if _RATE_LIMIT_RE.search(str(e)):
                 answer = "LLM temporarily rate-limited. Using offline heuristics until capacity returns."
             else:
                 answer = f"LLM Error: {e}"
@@ -129,12 +236,7 @@ def ask_ai():
 
 @bp.route('/')
 def home():
-    try:
-        mem = core.load_memory()
-        logs = _safe_logs(list(core.get_logs(mem))[-200:][::-1])
-    except Exception:
-        mem, logs = {"tasks": [], "logs": [], "state": {}}, []
-    return render_template('index.html', mem=mem, logs=logs)
+    return _render_cached('home', 'index.html')
 
 
 @bp.post('/task')
@@ -142,12 +244,10 @@ def add_task():
     task = (request.form.get('task') or '').strip()
     # Skip code-fence-only markers (``` or ```lang) to avoid no-op/bad tasks
     try:
-        _is_fence = getattr(core, "_is_code_fence_only", None)
-        if callable(_is_fence) and _is_fence(task):
+        if _cached_is_fence(task):
             # Do not enqueue; just refresh UI/redirect as if handled
             if request.headers.get('HX-Request'):
-                mem = core.load_memory()
-                return render_template('partials/tasks.html', mem=mem)
+                return ('', 204, {'HX-Trigger': 'tasks-changed'})
             return redirect(url_for('web.home'))
     except Exception:
         pass
@@ -157,20 +257,26 @@ def add_task():
     # Heuristic: if not explicitly LLM and not a shell command, coerce to 'llm: '
     if task and not task.lower().startswith('llm:'):
         try:
-            _is_cmd = getattr(core, "_is_shell_command", None)
-            if callable(_is_cmd) and not _is_cmd(task):
+            if not _cached_is_cmd(task):
                 task = f"llm: {task}"
         except Exception:
             pass
     if task:
         core.inject_task(task)
     if request.headers.get('HX-Request'):
-        # Return the refreshed tasks list fragment
-        mem = core.load_memory()
-        return render_template('partials/tasks.html', mem=mem)
+        # Empty response + event: the #tasks container re-fetches /tasks
+        # itself, skipping a render + memory load on the submit path
+        return ('', 204, {'HX-Trigger': 'tasks-changed'})
     return redirect(url_for('web.home'))
 
 
+@bp.get('/tasks')
+def tasks_partial():
+    """Current task list fragment, fetched by #tasks on 'tasks-changed'."""
+    mem = core.load_memory()
+    return render_template('partials/tasks.html', mem=mem)
+
+
 @bp.post('/tasks/bulk')
 def add_tasks_bulk():
     """Add multiple tasks at once. Accepts a newline-separated 'tasks' field or JSON array in 'tasks_json'."""
@@ -196,23 +302,42 @@ def add_tasks_bulk():
     except Exception:
         pass
 
-    for t in tasks:
-        core.inject_task(t)
+    # One load/save round-trip for the whole batch
+    if tasks:
+        core.inject_tasks(tasks)
 
     if request.headers.get('HX-Request'):
-        mem = core.load_memory()
-        return render_template('partials/tasks.html', mem=mem)
+        return ('', 204, {'HX-Trigger': 'tasks-changed'})
     return redirect(url_for('web.home'))
 
 
 @bp.get('/refresh')
 def refresh():
-    try:
-        mem = core.load_memory()
-        logs = _safe_logs(list(core.get_logs(mem))[-200:][::-1])
-    except Exception:
-        mem, logs = {"tasks": [], "logs": [], "state": {}}, []
-    return render_template('partials/state_logs.html', mem=mem, logs=logs)
+    return _render_cached('refresh', 'partials/state_logs.html')
+
+
+@bp.get('/events')
+def events():
+    """Server-sent events: push a 'changed' message on each memory write.
+
+    Clients can listen here and fetch /refresh only when something actually
+    changed, instead of re-rendering on a fixed polling cadence.
+    """
+    def stream():
+        seen = _mem_gen
+        while True:
+            with _mem_cond:
+                if _mem_gen == seen:
+                    _mem_cond.wait(timeout=25)
+                changed = _mem_gen != seen
+                seen = _mem_gen
+            if changed:
+                yield "data: changed\n\n"
+            else:
+                # Keep-alive comment so proxies don't drop the connection
+                yield ": keep-alive\n\n"
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @bp.post('/agent/start')
@@ -229,36 +354,43 @@ def stop_agent():
 
 @bp.post('/agent/auto')
 def start_autonomy():
-    global _auto_thread
     steps = request.form.get('steps', type=int) or 5
     goal = (request.form.get('goal') or '').strip() or None
-    if _auto_thread and _auto_thread.is_alive():
+    if _auto_busy.is_set():
+        return jsonify(status='busy')
+    try:
+        _auto_queue.put_nowait(lambda: _start_autonomy_cycle(goal, steps))
+    except queue.Full:
         return jsonify(status='busy')
-    _auto_thread = threading.Thread(target=_start_autonomy_cycle, args=(goal, steps), daemon=True)
-    _auto_thread.start()
     return jsonify(status='started', steps=steps)
 
 
 @bp.post('/agent/full-auto')
 def start_full_auto():
-    global _full_auto_thread
     goal = (request.form.get('goal') or '').strip() or None
-    if _full_auto_thread and _full_auto_thread.is_alive():
+    if _auto_busy.is_set():
         return jsonify(status='already-running')
     _stop_event.clear()
-    _full_auto_thread = threading.Thread(target=_start_full_autonomy, args=(goal,), daemon=True)
-    _full_auto_thread.start()
+    try:
+        _auto_queue.put_nowait(lambda: _start_full_autonomy(goal))
+    except queue.Full:
+        return jsonify(status='already-running')
     return jsonify(status='started', mode='full_auto')
 
 
+# Static responses built once; both endpoints are probed on a timer
+_HEALTH_OK_HTML = '<span id="health" style="color:#10b981">Health: OK</span>'
+_FAVICON_RESP = Response(b'', status=204)
+
+
 @bp.get('/health')
 def health():
     if request.headers.get('HX-Request'):
-        return '<span id="health" style="color:#10b981">Health: OK</span>'
+        return _HEALTH_OK_HTML
     return jsonify(ok=True, service='AGENT-i', status='ok')
 
 
 @bp.get('/favicon.ico')
 def favicon():
     # Silence 404s; you can add a real icon in web_ui/static later
-    return ('', 204)
+    return _FAVICON_RESP